@@ -1,32 +1,97 @@
 #!/usr/bin/env python3
+import copy
+import functools
+import hashlib
 import io
 import math
 import os
+import re
 import string
 import sys
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Optional, Sequence, Union
 
 from reportlab.lib.colors import Color, toColor
+from reportlab.lib.rl_accel import fp_str
 from reportlab.lib.pagesizes import A4, landscape, portrait
 from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfdoc
 from reportlab.pdfgen import canvas
+from reportlab.pdfgen.pathobject import PDFPathObject
 
-from svglib.svglib import svg2rlg
+from lxml import etree
+from svglib.svglib import PX_TO_PT, Svg2RlgShapeConverter, svg2rlg
 from reportlab.graphics import renderPDF
+from reportlab.graphics.shapes import Drawing, Group
+
+
+# Content digest of each SVG file, keyed by its path as found. Byte-identical
+# files (e.g. the same icon saved under several names) share one digest, so
+# the path does not need resolving for the caches below to be shared.
+_content_keys: dict[Path, bytes] = {}
+
+# Untinted drawings keyed by content digest: each distinct SVG is parsed once.
+_template_cache: dict[bytes, Optional[Drawing]] = {}
+
+# Tinted drawings keyed by (content digest, lowercase foreground hex).
+# ``renderPDF.draw`` does not mutate the drawing, so one instance can be
+# placed any number of times.
+_drawing_cache: dict[tuple[bytes, str], Optional[Drawing]] = {}
+
+# Tinted SVGs converted by CairoSVG (``--backend cairo``): the single page of
+# the resulting PDF, keyed like ``_drawing_cache``.
+_cairo_page_cache: dict[tuple[bytes, str], object] = {}
+
+# (width, height) of icons whose Form XObject has been emitted, keyed like
+# ``_drawing_cache``. Lets later placements skip loading the drawing, so the
+# drawing caches can be released page by page.
+_icon_sizes: dict[tuple[bytes, str], tuple[float, float]] = {}
+
+# ``#fff``/``#ffffff`` in any case, not followed by more hex digits. Used to
+# tint the SVG text before handing it to CairoSVG.
+_WHITE_HEX_RE = re.compile(rb"#(?:[fF]{3}){1,2}(?![0-9a-fA-F])")
+
+# Two-digit lowercase hex for each byte value, used to build ``#rrggbb``.
+_HEX2 = [f"{i:02x}" for i in range(256)]
+
+# Pieces of the game-icons.net SVG layout accepted by ``try_fast_single_path``.
+_SVG_NS = "{http://www.w3.org/2000/svg}"
+_FILL_HEX_RE = re.compile(r"#[0-9a-fA-F]{3}(?:[0-9a-fA-F]{3})?")
+_PX_LENGTH_RE = re.compile(r"\s*(\d+(?:\.\d*)?|\.\d+)\s*(?:px)?\s*")
+_IDENTITY_TRANSFORM_RE = re.compile(r"\s*(?:translate\(\s*0\s*(?:[,\s]\s*0\s*)?\))?\s*")
 
 
 def find_svgs(root: Path):
     if not root.exists():
         raise FileNotFoundError(f"Input directory does not exist: {root}")
-    svgs = []
-    for dirpath, _dirnames, filenames in os.walk(root):
-        for fn in filenames:
-            if fn.lower().endswith(".svg"):
-                svgs.append(Path(dirpath) / fn)
-    svgs.sort(key=lambda p: (str(p.parent), p.name))
-    return svgs
+    # Same traversal as os.walk (symlinked directories are not followed,
+    # unreadable directories are skipped), but scandir's cached entry types
+    # avoid extra stat calls, and the sort keys are plain strings. The
+    # directory is normalised through Path once per directory so that e.g.
+    # "./-dash" sorts as "-dash", as it would comparing Path parents.
+    found = []
+    stack = [str(root)]
+    while stack:
+        dirpath = stack.pop()
+        dir_key = None
+        try:
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                    elif entry.name.lower().endswith(".svg"):
+                        if dir_key is None:
+                            dir_key = str(Path(dirpath))
+                        found.append((dir_key, entry.name))
+        except OSError:
+            continue
+    found.sort()
+    return [Path(dirpath) / name for dirpath, name in found]
 
 
 def compute_grid(page_w: float, page_h: float, cell: float):
@@ -39,16 +104,21 @@ def compute_grid(page_w: float, page_h: float, cell: float):
     return cols, rows, off_x, off_y
 
 
+def compute_cells(cols: int, rows: int, off_x: float, off_y: float, cell: float):
+    """Lower-left corners of every cell on a page, in row-major order."""
+    xs = [off_x + col_index * cell for col_index in range(cols)]
+    return [(x, off_y + row_index * cell) for row_index in range(rows) for x in xs]
+
+
 def draw_page(
     c: canvas.Canvas,
     svgs: Sequence[Path],
     *,
+    cells: Sequence[tuple[float, float]],
     cols: int,
-    rows: int,
-    off_x: float,
-    off_y: float,
     cell_size: float,
     circle_diameter: float,
+    icon_max_side: float,
     grid_stroke_pt: float,
     grid_stroke_gray: float,
     circle_fill: Color,
@@ -56,23 +126,17 @@ def draw_page(
     annotate: bool,
     tooltip_root: Optional[Path],
     flip: bool,
+    backend: str = "svglib",
 ) -> None:
     if not svgs:
         return
 
-    for row_index in range(rows):
-        start = row_index * cols
+    for start in range(0, min(len(svgs), len(cells)), cols):
         row_svgs = list(svgs[start : start + cols])
-        if not row_svgs:
-            break
-
         if flip:
-            row_svgs = list(reversed(row_svgs))
-
-        for col_index, svg in enumerate(row_svgs):
-            cell_x = off_x + col_index * cell_size
-            cell_y = off_y + row_index * cell_size
+            row_svgs.reverse()
 
+        for (cell_x, cell_y), svg in zip(cells[start : start + cols], row_svgs):
             draw_svg_clipped(
                 c,
                 svg,
@@ -80,15 +144,160 @@ def draw_page(
                 cell_y,
                 cell_size=cell_size,
                 circle_diameter=circle_diameter,
+                icon_max_side=icon_max_side,
                 grid_stroke_pt=grid_stroke_pt,
                 grid_stroke_gray=grid_stroke_gray,
                 circle_fill=circle_fill,
                 foreground_hex=foreground_hex,
                 annotate=annotate,
                 tooltip_root=tooltip_root,
+                backend=backend,
             )
 
 
+def ensure_cell_forms(
+    c: canvas.Canvas,
+    *,
+    cell_size: float,
+    circle_diameter: float,
+    grid_stroke_pt: float,
+    grid_stroke_gray: float,
+    circle_fill: Color,
+) -> tuple[str, str]:
+    """Define the per-cell background and outline as Form XObjects.
+
+    Every cell shares the same geometry, so it is emitted once per canvas
+    (per circle color) and referenced with ``doForm`` at each placement.
+    Both forms are drawn with the cell's lower-left corner at the origin.
+    """
+    clip_radius = circle_diameter / 2.0
+
+    background_form = f"cellBg_{circle_fill.hexvala()[2:]}"
+    if not c.hasForm(background_form):
+        c.beginForm(background_form, 0, 0, cell_size, cell_size)
+        c.setFillColorRGB(1, 1, 1)
+        c.rect(0, 0, cell_size, cell_size, stroke=0, fill=1)
+        c.setFillColor(circle_fill)
+        c.circle(cell_size / 2.0, cell_size / 2.0, clip_radius, stroke=0, fill=1)
+        end_form_with_ext_gstate(c)
+
+    outline_form = "cellOutline"
+    if not c.hasForm(outline_form):
+        # Pad the bounding box so the outer half of the stroke is not clipped.
+        pad = grid_stroke_pt
+        c.beginForm(outline_form, -pad, -pad, cell_size + pad, cell_size + pad)
+        c.setLineWidth(grid_stroke_pt)
+        c.setStrokeGray(grid_stroke_gray)
+        c.rect(0, 0, cell_size, cell_size, stroke=1, fill=0)
+        end_form_with_ext_gstate(c)
+
+    return background_form, outline_form
+
+
+@functools.lru_cache(maxsize=None)
+def cell_clip_operators(cell_size: float, circle_diameter: float) -> str:
+    """PDF operators clipping to the cell's circle, in cell-local coordinates."""
+    clip_path = PDFPathObject()
+    clip_path.circle(cell_size / 2.0, cell_size / 2.0, circle_diameter / 2.0)
+    return f"{clip_path.getCode()} W* n"
+
+
+@functools.lru_cache(maxsize=None)
+def icon_placement(
+    dw: float, dh: float, *, cell_size: float, icon_max_side: float
+) -> tuple[float, float, float]:
+    """Scale and lower-left inset within a cell for an SVG of size dw x dh.
+
+    Icons from one set mostly share their dimensions, so results are cached.
+    """
+    scale = min(icon_max_side / dw, icon_max_side / dh)
+    inset_x = (cell_size - dw * scale) / 2.0
+    inset_y = (cell_size - dh * scale) / 2.0
+    return scale, inset_x, inset_y
+
+
+def end_form_with_ext_gstate(c: canvas.Canvas) -> None:
+    """Like ``c.endForm()`` but keeps the form's ExtGState resources.
+
+    ReportLab's form XObjects only declare fonts, so the ``gs`` operators
+    emitted for fill/stroke opacity (common in game-icons SVGs) would point
+    at undefined resources.
+    """
+    resources = pdfdoc.PDFResourceDictionary()
+    resources.basicFonts()
+    resources.allProcs()
+    ext_gstate = c._extgstate.getState()
+    if ext_gstate is not None:
+        resources.ExtGState = ext_gstate
+    c.endForm(Resources=resources)
+
+
+def _pdf_object_to_reportlab(obj, doc: pdfdoc.PDFDocument, memo: dict):
+    """Copy a pypdf object graph into ReportLab ``pdfdoc`` objects.
+
+    Indirect objects are registered on ``doc`` once each (tracked in
+    ``memo``); streams keep their encoded data and filters.
+    """
+    from pypdf import generic
+
+    if isinstance(obj, generic.IndirectObject):
+        key = (obj.idnum, obj.generation)
+        if key not in memo:
+            memo[key] = doc.Reference(_pdf_object_to_reportlab(obj.get_object(), doc, memo))
+        return memo[key]
+    if isinstance(obj, generic.StreamObject):
+        dictionary = _pdf_object_to_reportlab(
+            generic.DictionaryObject({k: v for k, v in obj.items() if k != "/Length"}), doc, memo
+        )
+        return pdfdoc.PDFStream(dictionary=dictionary, content=obj._data, filters=[])
+    if isinstance(obj, generic.DictionaryObject):
+        return pdfdoc.PDFDictionary(
+            {key[1:]: _pdf_object_to_reportlab(value, doc, memo) for key, value in obj.items()}
+        )
+    if isinstance(obj, generic.ArrayObject):
+        return pdfdoc.PDFArray([_pdf_object_to_reportlab(value, doc, memo) for value in obj])
+    if isinstance(obj, generic.NameObject):
+        return pdfdoc.PDFName(obj[1:])
+    if isinstance(obj, generic.BooleanObject):
+        return b"true" if obj else b"false"
+    if isinstance(obj, generic.NullObject):
+        return b"null"
+    if isinstance(obj, generic.FloatObject):
+        return float(obj)
+    if isinstance(obj, generic.NumberObject):
+        return int(obj)
+    if isinstance(obj, (generic.TextStringObject, generic.ByteStringObject)):
+        raw = obj.original_bytes if isinstance(obj, generic.TextStringObject) else bytes(obj)
+        return b"<" + raw.hex().encode("ascii") + b">"
+    raise ValueError(f"unsupported PDF object: {type(obj).__name__}")
+
+
+def add_pdf_page_form(
+    c: canvas.Canvas, name: str, page, bbox: tuple[float, float, float, float]
+) -> None:
+    """Register a pypdf page as a Form XObject named ``name`` on ``c``.
+
+    ``bbox`` is given relative to the page's lower-left corner.
+    """
+    x0 = float(page.mediabox.left)
+    y0 = float(page.mediabox.bottom)
+    lowerx, lowery, upperx, uppery = bbox
+    form = pdfdoc.PDFFormXObject(lowerx + x0, lowery + y0, upperx + x0, uppery + y0)
+    form.Matrix = pdfdoc.PDFArray([1, 0, 0, 1, -x0, -y0])
+    form.compression = c._pageCompression
+
+    contents = page.get_contents()
+    form.setStreamList(contents.get_data() if contents is not None else b"")
+
+    resources = page.get("/Resources")
+    if resources is None:
+        form.Resources = pdfdoc.PDFDictionary({})
+    else:
+        form.Resources = _pdf_object_to_reportlab(resources, c._doc, {})
+
+    c._doc.addForm(name, form)
+
+
 def draw_svg_clipped(
     c: canvas.Canvas,
     svg_path: Path,
@@ -97,12 +306,14 @@ def draw_svg_clipped(
     *,
     cell_size: float,
     circle_diameter: float,
+    icon_max_side: float,
     grid_stroke_pt: float,
     grid_stroke_gray: float,
     circle_fill: Color,
     foreground_hex: str,
     annotate: bool = False,
     tooltip_root: Optional[Path] = None,
+    backend: str = "svglib",
 ):
     """Draw a single cell:
        - white 1x1 in cell
@@ -111,64 +322,77 @@ def draw_svg_clipped(
        - hairline cell outline on top
     """
     clip_radius = circle_diameter / 2.0
-    icon_max_side_inside_circle = circle_diameter / math.sqrt(2.0)
-
-    # 1) Outer cell: WHITE background
-    c.saveState()
-    c.setFillColorRGB(1, 1, 1)
-    c.rect(cell_x, cell_y, cell_size, cell_size, stroke=0, fill=1)
-    c.restoreState()
-
-    # 2) Define circular clip centered in the cell
-    cx = cell_x + cell_size / 2.0
-    cy = cell_y + cell_size / 2.0
-    c.saveState()
-    clip_path = c.beginPath()
-    clip_path.circle(cx, cy, clip_radius)
-    c.clipPath(clip_path, stroke=0, fill=0)
-
-    # 3) Inside the circle: fill with the requested background color
-    c.setFillColor(circle_fill)
-    c.circle(cx, cy, clip_radius, stroke=0, fill=1)
-
-    # 4) Draw the SVG on top, scaled to fit the inscribed square
+    background_form, outline_form = ensure_cell_forms(
+        c,
+        cell_size=cell_size,
+        circle_diameter=circle_diameter,
+        grid_stroke_pt=grid_stroke_pt,
+        grid_stroke_gray=grid_stroke_gray,
+        circle_fill=circle_fill,
+    )
+
+    # The cell's operators are written straight to the content stream: every
+    # cell uses the same few operators, so going through saveState/translate/
+    # clipPath (Python graphics-state copies and path building per call)
+    # only adds overhead. Forms are still placed with doForm so the page
+    # records which XObjects it uses.
+    # 1) Outer cell: WHITE background with the filled circle (shared form)
+    c._code.append(f"q 1 0 0 1 {fp_str(cell_x, cell_y)} cm")
+    c.doForm(background_form)
+
+    # 2) Load the SVG
     try:
-        drawing = load_svg_with_foreground(svg_path, foreground_hex)
+        icon_key = _drawing_cache_key(svg_path, foreground_hex)
+        form_name = icon_form_name(icon_key)
+        if c.hasForm(form_name):
+            # Already emitted: only its size is needed to place it again.
+            dw, dh = _icon_sizes[icon_key]
+        elif backend == "cairo":
+            page = load_cached_cairo_page(svg_path, foreground_hex)
+            dw = float(page.mediabox.width)
+            dh = float(page.mediabox.height)
+        else:
+            drawing = load_cached_drawing(svg_path, foreground_hex)
+            dw = float(getattr(drawing, "width", 0) or 0)
+            dh = float(getattr(drawing, "height", 0) or 0)
     except Exception as e:
-        c.restoreState()
+        c._code.append("Q")
         print(f"[WARN] Skipping {svg_path}: {e}")
         return
 
-    dw = float(getattr(drawing, "width", 0) or 0)
-    dh = float(getattr(drawing, "height", 0) or 0)
     if dw <= 0 or dh <= 0:
-        c.restoreState()
+        c._code.append("Q")
         print(f"[WARN] Skipping {svg_path}: invalid SVG size ({dw}x{dh})")
         return
 
-    target_side_pts = icon_max_side_inside_circle  # in points
-    scale = min(target_side_pts / dw, target_side_pts / dh)
-
-    draw_w = dw * scale
-    draw_h = dh * scale
-    draw_x = cell_x + (cell_size - draw_w) / 2.0
-    draw_y = cell_y + (cell_size - draw_h) / 2.0
-
-    c.saveState()
-    c.translate(draw_x, draw_y)
-    c.scale(scale, scale)
-    renderPDF.draw(drawing, c, 0, 0)
-    c.restoreState()
-
-    # 5) End clipping
-    c.restoreState()
+    scale, inset_x, inset_y = icon_placement(
+        dw, dh, cell_size=cell_size, icon_max_side=icon_max_side
+    )
 
-    # 6) Hairline grid outline (on top so it's visible)
-    c.saveState()
-    c.setLineWidth(grid_stroke_pt)
-    c.setStrokeGray(grid_stroke_gray)
-    c.rect(cell_x, cell_y, cell_size, cell_size, stroke=1, fill=0)
-    c.restoreState()
+    # Emit the icon's shapes once as a form; later placements reference it.
+    if not c.hasForm(form_name):
+        # Cover everything the circular clip can reveal, in drawing units.
+        reach = clip_radius / scale
+        bbox = (dw / 2.0 - reach, dh / 2.0 - reach, dw / 2.0 + reach, dh / 2.0 + reach)
+        if backend == "cairo":
+            add_pdf_page_form(c, form_name, page, bbox)
+        else:
+            c.beginForm(form_name, *bbox)
+            renderPDF.draw(drawing, c, 0, 0)
+            end_form_with_ext_gstate(c)
+        _icon_sizes[icon_key] = (dw, dh)
+
+    # 3) Clip to the circle and draw the SVG scaled to fit the inscribed square
+    clip_ops = cell_clip_operators(cell_size, circle_diameter)
+    c._code.append(f"q {clip_ops} {fp_str(scale, 0, 0, scale, inset_x, inset_y)} cm")
+    c.doForm(form_name)
+
+    # 4) End clipping
+    c._code.append("Q")
+
+    # 5) Hairline grid outline (on top so it's visible)
+    c.doForm(outline_form)
+    c._code.append("Q")
 
     if annotate:
         tooltip_path: Union[Path, str] = svg_path
@@ -212,12 +436,297 @@ def add_text_annotation(c: canvas.Canvas, rect: list[float], text: str) -> None:
         legacy_add(annotation_dict)
 
 
-def load_svg_with_foreground(svg_path: Path, foreground_hex: str):
-    svg_text = svg_path.read_text(encoding="utf-8")
-    hex_lower = foreground_hex.lower()
-    hex_upper = foreground_hex.upper()
-    svg_text = svg_text.replace("#fff", hex_lower).replace("#FFF", hex_upper)
-    return svg2rlg(io.BytesIO(svg_text.encode("utf-8")))
+def svg_content_key(svg_path: Path, svg_bytes: Optional[bytes] = None) -> bytes:
+    try:
+        return _content_keys[svg_path]
+    except KeyError:
+        pass
+    if svg_bytes is None:
+        svg_bytes = svg_path.read_bytes()
+    key = hashlib.blake2b(svg_bytes, digest_size=16).digest()
+    _content_keys[svg_path] = key
+    return key
+
+
+def _content_key_and_bytes(svg_path: Path) -> tuple[bytes, Optional[bytes]]:
+    """Content digest of ``svg_path``, plus its bytes if they had to be read.
+
+    Lets a cache miss on a file seen for the first time hash and parse from
+    a single read.
+    """
+    try:
+        return _content_keys[svg_path], None
+    except KeyError:
+        pass
+    svg_bytes = svg_path.read_bytes()
+    return svg_content_key(svg_path, svg_bytes), svg_bytes
+
+
+class _PlainFillConverter(Svg2RlgShapeConverter):
+    """svglib's path converter with styling reduced to a plain fill.
+
+    ``applyStyleOnShape`` normally resolves the CSS/inheritance cascade for
+    every presentation attribute; ``try_fast_single_path`` only hands over
+    paths that have already been checked to carry nothing but a fill.
+    """
+
+    def applyStyleOnShape(self, shape, node, only_explicit=False):
+        ac = self.attrConverter
+        shape.fillColor = ac.convertColor(node.get("fill", "black"))
+        shape.fillOpacity = 1
+        shape.fillMode = ac.convertFillRule(node.get("fill-rule", "nonzero"))
+        shape.strokeColor = None
+
+
+def _px_length(value: str) -> Optional[float]:
+    match = _PX_LENGTH_RE.fullmatch(value)
+    return float(match.group(1)) if match else None
+
+
+def try_fast_single_path(svg_bytes: bytes) -> Optional[Drawing]:
+    """Build the drawing of a plain single-path icon without svglib's tree walk.
+
+    Accepts the game-icons.net layout: an ``<svg>`` whose size (if given)
+    matches its viewBox, identity ``<g>`` wrappers, an optional invisible
+    backdrop path and exactly one ``<path>`` with a hex fill. Returns
+    ``None`` for anything else so the caller can fall back to ``svg2rlg``.
+    """
+    view_box = None
+    path_node = None
+    try:
+        for _, node in etree.iterparse(
+            io.BytesIO(svg_bytes), events=("start",), resolve_entities=False
+        ):
+            tag, attrs = node.tag, node.attrib
+            if view_box is None:
+                if tag != _SVG_NS + "svg" or set(attrs) - {"viewBox", "width", "height", "style"}:
+                    return None
+                view_box = [float(v) for v in re.split(r"[\s,]+", attrs.get("viewBox", "").strip())]
+                if len(view_box) != 4:
+                    return None
+                sizes = {"width": attrs.get("width"), "height": attrs.get("height")}
+                for declaration in attrs.get("style", "").split(";"):
+                    name, _, value = declaration.partition(":")
+                    name = name.strip()
+                    if name in sizes:
+                        sizes[name] = value  # CSS overrides the attribute, as in svglib
+                    elif name:
+                        return None
+                for name, expected in (("width", view_box[2]), ("height", view_box[3])):
+                    if sizes[name] is not None and _px_length(sizes[name]) != expected:
+                        return None
+            elif tag == _SVG_NS + "g":
+                if (
+                    set(attrs) - {"class", "style", "transform"}
+                    or attrs.get("style", "").strip()
+                    or not _IDENTITY_TRANSFORM_RE.fullmatch(attrs.get("transform", ""))
+                ):
+                    return None
+            elif tag == _SVG_NS + "path":
+                if set(attrs) - {"d", "fill", "fill-opacity", "fill-rule"}:
+                    return None
+                fill = attrs.get("fill", "#000").strip()
+                opacity = float(attrs.get("fill-opacity", "1"))
+                if fill == "none" or opacity == 0:
+                    continue
+                if opacity != 1 or not _FILL_HEX_RE.fullmatch(fill) or path_node is not None:
+                    return None
+                path_node = node
+            else:
+                return None
+        if path_node is None:
+            return None
+        shape = _PlainFillConverter(None).convertPath(path_node)
+    except (etree.XMLSyntaxError, ValueError, TypeError, IndexError):
+        return None
+    if shape is None:
+        return None
+
+    x, y, width, height = view_box
+    main_group = Group(shape)
+    main_group.scale(PX_TO_PT, -PX_TO_PT)
+    main_group.translate(-x, -height - y)
+    drawing = Drawing(width * PX_TO_PT, height * PX_TO_PT)
+    drawing.add(main_group)
+    return drawing
+
+
+def load_svg_template(svg_bytes: bytes) -> Optional[Drawing]:
+    drawing = try_fast_single_path(svg_bytes)
+    if drawing is None:
+        drawing = svg2rlg(io.BytesIO(svg_bytes))
+    return drawing
+
+
+def load_cached_template(svg_path: Path) -> Optional[Drawing]:
+    key, svg_bytes = _content_key_and_bytes(svg_path)
+    try:
+        return _template_cache[key]
+    except KeyError:
+        pass
+    if svg_bytes is None:
+        svg_bytes = svg_path.read_bytes()
+    template = load_svg_template(svg_bytes)
+    _template_cache[key] = template
+    return template
+
+
+def apply_foreground(node, target: Color) -> None:
+    """Recolor white fills and strokes below ``node`` to ``target`` in place.
+
+    Each shape keeps its own alpha so fill/stroke opacity is preserved.
+    """
+    for attr in ("fillColor", "strokeColor"):
+        color = getattr(node, attr, None)
+        if isinstance(color, Color) and (color.red, color.green, color.blue) == (1, 1, 1):
+            setattr(node, attr, Color(target.red, target.green, target.blue, alpha=color.alpha))
+
+    for child in getattr(node, "contents", ()):
+        apply_foreground(child, target)
+
+
+def _is_white(foreground_hex: str) -> bool:
+    return foreground_hex.lower() in ("#ffffff", "#fff")
+
+
+def load_svg_with_foreground(svg_path: Path, foreground_hex: str) -> Optional[Drawing]:
+    template = load_cached_template(svg_path)
+    if template is None or _is_white(foreground_hex):
+        # Recoloring white to white is a no-op; share the untinted template.
+        return template
+    drawing = copy.deepcopy(template)
+    apply_foreground(drawing, toColor(foreground_hex))
+    return drawing
+
+
+def load_cairo_page(svg_bytes: bytes, foreground_hex: str):
+    """Convert the tinted SVG to a one-page PDF with CairoSVG.
+
+    Returns the pypdf page; its content stream is embedded as a form.
+    """
+    import cairosvg
+    from pypdf import PdfReader
+
+    if not _is_white(foreground_hex):
+        svg_bytes = _WHITE_HEX_RE.sub(foreground_hex.lower().encode("ascii"), svg_bytes)
+    pdf_bytes = cairosvg.svg2pdf(bytestring=svg_bytes)
+    return PdfReader(io.BytesIO(pdf_bytes)).pages[0]
+
+
+def load_cached_cairo_page(svg_path: Path, foreground_hex: str):
+    content_key, svg_bytes = _content_key_and_bytes(svg_path)
+    key = (content_key, foreground_hex.lower())
+    try:
+        return _cairo_page_cache[key]
+    except KeyError:
+        pass
+    if svg_bytes is None:
+        svg_bytes = svg_path.read_bytes()
+    page = load_cairo_page(svg_bytes, foreground_hex)
+    _cairo_page_cache[key] = page
+    return page
+
+
+def _drawing_cache_key(svg_path: Path, foreground_hex: str) -> tuple[bytes, str]:
+    return svg_content_key(svg_path), foreground_hex.lower()
+
+
+def load_cached_drawing(svg_path: Path, foreground_hex: str) -> Optional[Drawing]:
+    key = _drawing_cache_key(svg_path, foreground_hex)
+    try:
+        return _drawing_cache[key]
+    except KeyError:
+        pass
+    drawing = load_svg_with_foreground(svg_path, foreground_hex)
+    _drawing_cache[key] = drawing
+    return drawing
+
+
+def icon_form_name(icon_key: tuple[bytes, str]) -> str:
+    """Form XObject name shared by every SVG with the same content and color."""
+    content_key, hex_lower = icon_key
+    return f"icon_{content_key.hex()}_{hex_lower.lstrip('#')}"
+
+
+def release_drawings(svgs: Sequence[Path], foreground_hexes: Sequence[str]) -> None:
+    """Drop cached drawings for ``svgs`` once their pages are written.
+
+    Their forms already hold the PDF operators, so keeping the ReportLab
+    trees would only grow memory with the number of pages.
+    """
+    for svg in svgs:
+        content_key = _content_keys.get(svg)
+        if content_key is None:
+            continue
+        _template_cache.pop(content_key, None)
+        for foreground_hex in foreground_hexes:
+            icon_key = (content_key, foreground_hex.lower())
+            _drawing_cache.pop(icon_key, None)
+            _cairo_page_cache.pop(icon_key, None)
+
+
+def _warmup_worker() -> None:
+    """Parse a trivial SVG so a pool worker's first real icon isn't slower.
+
+    Runs as the executor's ``initializer``: each worker pays its first-call
+    setup while the others start up, not while the parent waits on a result.
+    """
+    load_svg_template(b'<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1"/>')
+
+
+def preload_templates(
+    svgs: Sequence[Path],
+    foreground_hexes: Sequence[str],
+    *,
+    executor: ProcessPoolExecutor,
+    jobs: int,
+) -> None:
+    """Parse SVGs in worker processes and store them in the template cache.
+
+    svg2rlg is pure Python, so parsing in a process pool sidesteps the GIL.
+    Only the parent process touches the canvas; drawings are pickled back
+    and tinted there. Each distinct file content is sent to a worker once,
+    and not at all if its forms for ``foreground_hexes`` already exist.
+    Failed parses are left out of the cache so that ``draw_svg_clipped``
+    reports them when it retries.
+    """
+    pending: dict[bytes, bytes] = {}
+    for svg in svgs:
+        try:
+            key, svg_bytes = _content_key_and_bytes(svg)
+            if key in _template_cache or key in pending:
+                continue
+            if all((key, h.lower()) in _icon_sizes for h in foreground_hexes):
+                continue
+            if svg_bytes is None:
+                svg_bytes = svg.read_bytes()
+        except OSError:
+            continue
+        pending[key] = svg_bytes
+
+    if len(pending) < 2:
+        return
+
+    jobs_iter = iter(pending.items())
+    in_flight = deque()
+
+    def submit_next() -> None:
+        job = next(jobs_iter, None)
+        if job is not None:
+            key, svg_bytes = job
+            in_flight.append((key, executor.submit(load_svg_template, svg_bytes)))
+
+    # Keep a bounded window of jobs ahead of the one being collected.
+    for _ in range(2 * jobs):
+        submit_next()
+
+    while in_flight:
+        key, future = in_flight.popleft()
+        submit_next()
+        try:
+            _template_cache[key] = future.result()
+        except Exception:
+            pass
 
 
 def parse_color(value: str, *, default: str) -> tuple[Color, str]:
@@ -232,15 +741,28 @@ def parse_color(value: str, *, default: str) -> tuple[Color, str]:
     else:
         color_spec = raw
 
+    # ReportLab reads ``#rgb`` as the integer 0x000rgb rather than as CSS
+    # shorthand, so ``fff`` would come out as ``#000fff``. Expand it first.
+    short_hex = color_spec[1:]
+    if (
+        color_spec.startswith("#")
+        and len(short_hex) == 3
+        and all(ch in string.hexdigits for ch in short_hex)
+    ):
+        color_spec = "#" + "".join(ch * 2 for ch in short_hex)
+
     color = toColor(color_spec)
 
     # ReportLab's ``hexval`` includes a ``0x`` prefix (e.g., ``0x00ff00``).
     # Normalize the color to the standard ``#rrggbb`` format expected by web
     # colors so downstream code receives the canonical representation.
-    r = max(0, min(255, int(round(color.red * 255))))
-    g = max(0, min(255, int(round(color.green * 255))))
-    b = max(0, min(255, int(round(color.blue * 255))))
-    hex_value = f"#{r:02x}{g:02x}{b:02x}"
+    r = int(round(color.red * 255))
+    g = int(round(color.green * 255))
+    b = int(round(color.blue * 255))
+    r = 0 if r < 0 else 255 if r > 255 else r
+    g = 0 if g < 0 else 255 if g > 255 else g
+    b = 0 if b < 0 else 255 if b > 255 else b
+    hex_value = "#" + _HEX2[r] + _HEX2[g] + _HEX2[b]
     return color, hex_value
 
 
@@ -310,6 +832,30 @@ def parse_args(argv=None):
         action="store_true",
         help="Generate a flipped companion page for double-sided printing.",
     )
+    parser.add_argument(
+        "--backend",
+        choices=["svglib", "cairo"],
+        default="svglib",
+        help=(
+            "SVG converter: pure-Python svglib or CairoSVG "
+            "(needs cairosvg and pypdf; default: svglib)."
+        ),
+    )
+    parser.add_argument(
+        "--compress",
+        choices=["auto", "on", "off"],
+        default="auto",
+        help="Compress PDF streams; auto turns it off above 500 icons for speed (default: auto).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help=(
+            "Worker processes used to parse SVGs with svglib; "
+            "unused with --backend cairo (default: CPU count)."
+        ),
+    )
 
     return parser.parse_args(argv)
 
@@ -317,6 +863,11 @@ def parse_args(argv=None):
 def main(argv=None):
     args = parse_args(argv)
 
+    # The caches describe one output canvas and the files as read during this
+    # run; a second call in the same process must not reuse either.
+    for cache in (_content_keys, _template_cache, _drawing_cache, _cairo_page_cache, _icon_sizes):
+        cache.clear()
+
     input_dir: Path = args.input_dir.expanduser()
     output_pdf: Path = args.output_pdf.expanduser()
 
@@ -344,6 +895,8 @@ def main(argv=None):
     PAGE_WIDTH, PAGE_HEIGHT = pagesize
     CELL_SIZE = args.cell_size_in * inch
     CIRCLE_DIAMETER = args.circle_diameter_in * inch
+    # Largest square icon that fits inside the circle
+    ICON_MAX_SIDE = CIRCLE_DIAMETER / math.sqrt(2.0)
     GRID_STROKE_PT = float(args.grid_hairline_pt)
     GRID_STROKE_GRAY = min(max(args.grid_gray, 0.0), 1.0)
 
@@ -352,26 +905,54 @@ def main(argv=None):
         print(f"ERROR: No SVGs found under: {input_dir}", file=sys.stderr)
         return 1
 
-    c = canvas.Canvas(str(output_pdf), pagesize=pagesize)
+    if args.backend == "cairo":
+        try:
+            import cairosvg  # noqa: F401
+            import pypdf  # noqa: F401
+        except (ImportError, OSError) as exc:
+            print(f"ERROR: --backend cairo needs cairosvg and pypdf: {exc}", file=sys.stderr)
+            return 2
+
+    # zlib on every content stream is a large share of the write time for
+    # big batches; trade file size for speed there unless asked otherwise.
+    if args.compress == "auto":
+        page_compression = 0 if len(svgs) > 500 else 1
+    else:
+        page_compression = 1 if args.compress == "on" else 0
+
+    c = canvas.Canvas(str(output_pdf), pagesize=pagesize, pageCompression=page_compression)
     cols, rows, off_x, off_y = compute_grid(PAGE_WIDTH, PAGE_HEIGHT, CELL_SIZE)
     per_page = cols * rows
+    cells = compute_cells(cols, rows, off_x, off_y, CELL_SIZE)
 
     tooltip_root = input_dir if args.annotate else None
-    pages = [svgs[i : i + per_page] for i in range(0, len(svgs), per_page)]
-
-    for page_index, page_svgs in enumerate(pages):
+    page_count = math.ceil(len(svgs) / per_page)
+    page_hexes = [foreground_hex, background_hex] if args.flip else [foreground_hex]
+
+    # Templates are parsed one page at a time and released once the page
+    # (and its flipped companion) is written, bounding memory by a page's
+    # worth of drawings rather than the whole input.
+    executor = None
+    if args.backend == "svglib" and args.jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=args.jobs, initializer=_warmup_worker)
+
+    svg_iter = iter(svgs)
+    page_batches = iter(lambda: list(islice(svg_iter, per_page)), [])
+    for page_index, page_svgs in enumerate(page_batches):
         if page_index > 0:
             c.showPage()
 
+        if executor is not None:
+            preload_templates(page_svgs, page_hexes, executor=executor, jobs=args.jobs)
+
         draw_page(
             c,
             page_svgs,
+            cells=cells,
             cols=cols,
-            rows=rows,
-            off_x=off_x,
-            off_y=off_y,
             cell_size=CELL_SIZE,
             circle_diameter=CIRCLE_DIAMETER,
+            icon_max_side=ICON_MAX_SIDE,
             grid_stroke_pt=GRID_STROKE_PT,
             grid_stroke_gray=GRID_STROKE_GRAY,
             circle_fill=background_color,
@@ -379,6 +960,7 @@ def main(argv=None):
             annotate=args.annotate,
             tooltip_root=tooltip_root,
             flip=False,
+            backend=args.backend,
         )
 
         if args.flip:
@@ -386,12 +968,11 @@ def main(argv=None):
             draw_page(
                 c,
                 page_svgs,
+                cells=cells,
                 cols=cols,
-                rows=rows,
-                off_x=off_x,
-                off_y=off_y,
                 cell_size=CELL_SIZE,
                 circle_diameter=CIRCLE_DIAMETER,
+                icon_max_side=ICON_MAX_SIDE,
                 grid_stroke_pt=GRID_STROKE_PT,
                 grid_stroke_gray=GRID_STROKE_GRAY,
                 circle_fill=foreground_color,
@@ -399,10 +980,16 @@ def main(argv=None):
                 annotate=args.annotate,
                 tooltip_root=tooltip_root,
                 flip=True,
+                backend=args.backend,
             )
 
+        release_drawings(page_svgs, page_hexes)
+
+    if executor is not None:
+        executor.shutdown()
+
     c.save()
-    total_pages = len(pages) * (2 if args.flip else 1)
+    total_pages = page_count * (2 if args.flip else 1)
     print(
         f"✅ Wrote {len(svgs)} icons to {output_pdf} "
         f"({cols}×{rows} cells; {per_page} icons/page; page={args.page}; pages={total_pages})."